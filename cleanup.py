@@ -15,16 +15,24 @@ Designed for very large WAV files (multi-GB, multi-hour):
 
 Requirements:
   pip install soundfile numpy tqdm
+  (NumPy 1.22+ recommended: its min/max reductions, which do the per-chunk peak work,
+   are SIMD-vectorized on both x86 (AVX2/AVX-512) and ARM (NEON))
 """
 
 from __future__ import annotations
 
 import csv
 import os
+import queue
+import sqlite3
+import struct
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Tuple
+from typing import Iterator, NamedTuple, Optional, Tuple, Union
 
 import numpy as np
 import soundfile as sf
@@ -46,13 +54,31 @@ NUM_SAMPLES_PER_FILE = 16
 #  - 1e-4 better matches "effectively silent" real-world files (tiny noise/dither/DC won't block deletion)
 SILENCE_THRESHOLD = 1e-4
 
+# Optional: instead of reading each whole INTERVAL_SECONDS chunk, read BURSTS_PER_INTERVAL
+# short bursts of BURST_FRAMES frames spread evenly across it (0 disables: full chunks).
+# e.g. 8 x 4096 frames reads ~1/10 of a 7 s chunk at 48 kHz: far less I/O on cold storage,
+# but a sound that falls entirely between bursts is not seen. Audit before deleting.
+BURSTS_PER_INTERVAL = 0
+BURST_FRAMES = 4096
+
 # Optional: only consider files at/above this size (0 disables the filter)
 MIN_SIZE_BYTES = 0
+
+# How many files are scanned at once, i.e. how many reads are in flight.
+# None = auto (4 per CPU core, capped at 32). Fast NVMe / NAS storage usually benefits from
+# more (64-128); a single spinning disk from fewer (2-4), since extra seeks just thrash.
+MAX_WORKERS: Optional[int] = None
+
+# Optional: remember scan results between runs (keyed by path + size + mtime), so re-runs
+# while tuning SILENCE_THRESHOLD don't re-open unchanged files. None disables the cache.
+SCAN_CACHE_DB: Optional[Path] = Path(".wav_scan_cache.db").resolve()
 # =============================================================
 
 
-@dataclass
-class ScanResult:
+class ScanResult(NamedTuple):
+    # One per scanned file, so kept small: a NamedTuple has no per-instance __dict__
+    # (and is immutable; use _replace() to derive a modified copy)
+
     # What file did we scan?
     path: str
 
@@ -75,15 +101,69 @@ class ScanResult:
     num_samples_used: int
     threshold: float
 
-    # The loudest peak we saw in any sampled chunk (useful for tuning threshold)
+    # The loudest peak we saw in any sampled chunk (useful for tuning threshold).
+    # Exact for SILENT files; for KEEP files scanning stops at the first loud block,
+    # so it is only the peak seen up to that point.
     max_abs_seen: float
 
 
-def find_wav_files(root: Path) -> list[Path]:
+# Bounded hand-off between the directory walker and the scanners: the walker can run ahead
+# of scanning, but never keeps more than this many paths in memory
+WALK_QUEUE_SIZE = 1000
+
+# What the walker hands to the scanners: a .wav path and its stat (None if stat failed)
+WalkItem = Tuple[Path, Optional[os.stat_result]]
+
+
+def walk_wav_files(root: Path, out: queue.Queue[Optional[WalkItem]]) -> None:
     """
-    Recursively gather all .wav files so tqdm can show a true progress bar (known total).
+    Producer: walk root with os.scandir and put each .wav file on out as soon as it is
+    found, as (path, stat), then None once the walk is finished.
+
+    The stat comes from DirEntry.stat(), which is cached from the directory listing on
+    Windows and saves the scan its own stat() round-trip (one per file on a network
+    share). It is None if stat failed; the scan then retries and reports the error.
+
+    Runs on its own thread, so scanning starts right away instead of after the whole
+    tree has been listed (which can take minutes on a big NAS share).
+    Like Path.rglob, this doesn't descend into symlinked directories and skips
+    directories it can't read.
     """
-    return [p for p in root.rglob("*") if p.is_file() and p.suffix.lower() == ".wav"]
+    try:
+        stack = [str(root)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    for entry in it:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append(entry.path)
+                            elif entry.name.lower().endswith(".wav") and entry.is_file():
+                                try:
+                                    st: Optional[os.stat_result] = entry.stat()
+                                except OSError:
+                                    st = None
+                                out.put((Path(entry.path), st))
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+    finally:
+        out.put(None)
+
+
+def bit_reversal_order(n: int) -> list[int]:
+    """
+    Indices 0..n-1 in bit-reversed (Van der Corput) order, e.g. for n=8:
+      0, 4, 2, 6, 1, 5, 3, 7
+    Each prefix of this order is spread across the whole range (start, middle, quarters,
+    eighths, ...), which is what we want when probing a file and stopping early.
+    """
+    if n <= 1:
+        return list(range(n))
+    bits = (n - 1).bit_length()
+    order = [int(format(i, f"0{bits}b")[::-1], 2) for i in range(1 << bits)]
+    return [i for i in order if i < n]
 
 
 def compute_sample_positions(
@@ -102,7 +182,12 @@ def compute_sample_positions(
         frames_per_interval: how many frames to read for each chunk
 
     We sample at evenly spaced positions from start to end to increase confidence
-    without scanning the entire file.
+    without scanning the entire file. Short files get fewer, non-overlapping chunks
+    that still cover them end to end.
+
+    The starts are returned in coarse-to-fine order (see bit_reversal_order), not
+    left-to-right: a non-silent file usually hits a loud chunk within the first one or
+    two probes, while a silent file still gets every position checked.
     """
     frames_per_interval = int(sr * interval_seconds)
     if sr <= 0 or total_frames <= 0 or frames_per_interval <= 0:
@@ -115,23 +200,564 @@ def compute_sample_positions(
     # Largest starting frame that still allows reading a full chunk
     max_start = total_frames - frames_per_interval
 
+    # Short files don't need num_samples chunks: this many back-to-back chunks already cover
+    # the whole file, and any more would only re-read overlapping audio. (So files shorter
+    # than num_samples * interval_seconds are scanned essentially in full, once.)
+    chunks_to_cover_file = -(-total_frames // frames_per_interval)
+    num = min(max(1, num_samples), chunks_to_cover_file)
+
     # Evenly spaced chunk starts across the file
-    starts = np.linspace(0, max_start, num=max(1, num_samples), dtype=np.int64)
+    starts = np.linspace(0, max_start, num=num, dtype=np.int64)
 
     # Remove duplicates (can happen if file is short and num_samples is big)
     starts = np.unique(starts)
+
+    # Probe order: spread the first few probes across the whole file
+    starts = starts[bit_reversal_order(starts.size)]
     return starts, frames_per_interval
 
 
-def scan_wav_for_silence(wav_path: Path) -> ScanResult:
+def peak_abs(data: np.ndarray) -> float:
+    """
+    Peak absolute amplitude of a chunk.
+
+    Same value as np.max(np.abs(data)), but built from max() and min() reductions so no
+    abs() temporary the size of the chunk is allocated (and written, then re-read).
+    Works for int16 chunks too: negating min() as a Python float avoids the int16
+    wrap-around of abs(-32768).
+    """
+    if data.size == 0:
+        return 0.0
+    return max(float(data.max()), -float(data.min()))
+
+
+def chunk_reads(starts: np.ndarray, frames_per_interval: int, total_frames: int) -> list[Tuple[int, int]]:
+    """
+    The (start_frame, num_frames) reads that cover the sampled chunks, in probe order:
+      - by default one read per chunk, the full interval
+      - with BURSTS_PER_INTERVAL > 0, that many BURST_FRAMES-long reads spaced evenly
+        across each chunk (unless the bursts would cover the whole chunk anyway)
+
+    A file shorter than one interval is a single chunk of total_frames, so its bursts are
+    spread across the file rather than the nominal interval; no read starts at or past the
+    end of the file (libsndfile fails the seek).
+    """
+    span = min(frames_per_interval, total_frames)
+    if BURSTS_PER_INTERVAL <= 0 or BURSTS_PER_INTERVAL * BURST_FRAMES >= span:
+        return [(int(start), frames_per_interval) for start in starts]
+
+    spacing = span // BURSTS_PER_INTERVAL
+    return [
+        (int(start) + k * spacing, BURST_FRAMES)
+        for start in starts
+        for k in range(BURSTS_PER_INTERVAL)
+        if int(start) + k * spacing < total_frames
+    ]
+
+
+# Chunks are checked block by block so a loud chunk is rejected after its first block
+# instead of after a full 7-second reduction. The first block is this many samples; each
+# following block is twice as big, so a silent chunk costs a handful of NumPy calls instead
+# of one per block (the per-call overhead, not the arithmetic, dominated with fixed-size
+# blocks).
+PEAK_BLOCK_SAMPLES = 16384
+
+
+def exceeds_limit(data: np.ndarray, limit: float) -> Tuple[bool, float]:
+    """
+    Does any sample in the chunk have an absolute value above limit?
+
+    Returns (exceeded, peak):
+      - exceeded: True as soon as one block's peak is above limit (the rest is skipped)
+      - peak: the largest peak seen, i.e. the exact chunk peak when not exceeded,
+              and only a lower bound when we stopped early
+    """
+    flat = data.reshape(-1)
+    block = PEAK_BLOCK_SAMPLES
+    peak = 0.0
+    i = 0
+    while i < flat.size:
+        peak = max(peak, peak_abs(flat[i:i + block]))
+        if peak > limit:
+            return True, peak
+        i += block
+        block *= 2
+    return False, peak
+
+
+# Bump whenever the sampling logic itself changes (which chunks are read, or how), so cached
+# results from an older version of this script are never reused
+SCAN_ALGORITHM_VERSION = 2
+
+
+def scan_params_key() -> str:
+    """
+    Identifies the sampling settings a cached result was produced with. If any of these
+    change, the sampled chunks change too, so old results must not be reused.
+    (SILENCE_THRESHOLD is deliberately not part of the key: see ScanCache.lookup.)
+    """
+    key = f"v={SCAN_ALGORITHM_VERSION};interval={INTERVAL_SECONDS};samples={NUM_SAMPLES_PER_FILE}"
+    if BURSTS_PER_INTERVAL > 0:
+        key += f";bursts={BURSTS_PER_INTERVAL}x{BURST_FRAMES}"
+    return key
+
+
+class ScanCache:
+    """
+    sqlite-backed cache of per-file scan results, shared by all worker threads.
+
+    We store the loudest peak seen rather than the decision, so a cached entry can be
+    re-judged against whatever SILENCE_THRESHOLD the current run uses.
+
+    The cache is only an accelerator: if the database is locked (another run) or broken,
+    lookups count as misses and stores are skipped, and scanning carries on.
+    """
+
+    # Commit after this many stores (a crash loses at most this many cached results)
+    COMMIT_EVERY = 100
+
+    # How long a statement waits on a database locked by another process. Kept short:
+    # it is held under self._lock, so every worker thread waits with it.
+    BUSY_TIMEOUT_SEC = 0.1
+
+    def __init__(self, db_path: Path) -> None:
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(db_path), timeout=self.BUSY_TIMEOUT_SEC, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._pending = 0
+        with self._lock:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS scans (
+                    path TEXT PRIMARY KEY,
+                    size_bytes INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    params TEXT NOT NULL,
+                    duration_sec REAL NOT NULL,
+                    samplerate INTEGER NOT NULL,
+                    channels INTEGER NOT NULL,
+                    num_samples_used INTEGER NOT NULL,
+                    max_abs_seen REAL NOT NULL,
+                    complete INTEGER NOT NULL
+                )
+                """
+            )
+            self._conn.commit()
+
+    def lookup(self, path: str, size_bytes: int, mtime_ns: int) -> Optional[ScanResult]:
+        """
+        Returns a KEEP/SILENT result for an unchanged file, or None if it must be scanned.
+
+        - A peak above the current threshold means KEEP (that sample really exists)
+        - A peak at/below the threshold means SILENT, but only if the earlier scan read
+          every sampled chunk ("complete"); a KEEP scan that stopped early under a lower
+          threshold doesn't tell us enough, so it is rescanned
+        """
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT duration_sec, samplerate, channels, num_samples_used, max_abs_seen, complete "
+                    "FROM scans WHERE path = ? AND size_bytes = ? AND mtime_ns = ? AND params = ?",
+                    (path, size_bytes, mtime_ns, scan_params_key()),
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+
+        if row is None:
+            return None
+
+        duration_sec, sr, ch, num_samples_used, max_abs_seen, complete = row
+        if max_abs_seen > SILENCE_THRESHOLD:
+            decision = "KEEP"
+            detail = f"Non-silent chunk found (peak={max_abs_seen:.6g} > threshold, cached scan)."
+        elif complete:
+            decision = "SILENT"
+            detail = "All sampled chunks were below threshold (cached scan)."
+        else:
+            return None
+
+        return ScanResult(
+            path=path,
+            decision=decision,
+            detail=detail,
+            size_bytes=size_bytes,
+            duration_sec=duration_sec,
+            samplerate=sr,
+            channels=ch,
+            interval_seconds=INTERVAL_SECONDS,
+            num_samples_used=num_samples_used,
+            threshold=SILENCE_THRESHOLD,
+            max_abs_seen=max_abs_seen,
+        )
+
+    def store(self, res: ScanResult, mtime_ns: int) -> None:
+        """Remember a KEEP/SILENT result (SILENT means every sampled chunk was read)."""
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO scans VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        res.path,
+                        res.size_bytes,
+                        mtime_ns,
+                        scan_params_key(),
+                        res.duration_sec,
+                        res.samplerate,
+                        res.channels,
+                        res.num_samples_used,
+                        res.max_abs_seen,
+                        int(res.decision == "SILENT"),
+                    ),
+                )
+                self._pending += 1
+                if self._pending >= self.COMMIT_EVERY:
+                    self._conn.commit()
+                    self._pending = 0
+        except sqlite3.Error:
+            # Not cached this time; the file is simply scanned again next run
+            pass
+
+    def forget(self, path: str) -> None:
+        """Drop the entry for a file we deleted (a stale entry is harmless: no file, no lookup)."""
+        try:
+            with self._lock:
+                self._conn.execute("DELETE FROM scans WHERE path = ?", (path,))
+                self._pending += 1
+        except sqlite3.Error:
+            pass
+
+    def close(self) -> None:
+        with self._lock:
+            try:
+                self._conn.commit()
+            except sqlite3.Error:
+                pass
+            self._conn.close()
+
+
+@contextmanager
+def sampling_source(wav_path: Path) -> Iterator[Union[int, Path]]:
+    """
+    What to read from: an already-open file descriptor where the OS has os.pread or
+    page-cache advice (Linux / BSD / macOS), otherwise just the path.
+
+    - POSIX_FADV_RANDOM turns off read-ahead, which would otherwise prefetch far past
+      each short chunk toward data we never look at
+    - POSIX_FADV_DONTNEED afterwards drops the pages we read, so a one-off scan of a huge
+      archive doesn't push everything else out of the page cache
+
+    The advice is per open file, so the readers have to go through this same descriptor.
+    """
+    if not hasattr(os, "pread") and not hasattr(os, "posix_fadvise"):
+        # e.g. Windows: nothing to gain from a descriptor, and fds don't cross C runtimes
+        # reliably anyway (libsndfile opens the path itself)
+        yield wav_path
+        return
+
+    fd = os.open(wav_path, os.O_RDONLY)
+    advise = hasattr(os, "posix_fadvise")
+    try:
+        if advise:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_RANDOM)
+        yield fd
+    finally:
+        try:
+            if advise:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+
+
+@dataclass
+class PcmLayout:
+    """Where the samples of a plain 16-bit PCM WAV live (see parse_pcm16_wav_header)."""
+    samplerate: int
+    channels: int
+
+    # Byte offset of the first frame, i.e. the start of the "data" chunk body
+    data_offset: int
+    total_frames: int
+
+
+def parse_pcm16_wav_header(fd: int, file_size: int) -> Optional[PcmLayout]:
+    """
+    Minimal RIFF/WAVE header parser for the common case: uncompressed 16-bit PCM
+    (WAVE_FORMAT_PCM, or WAVE_FORMAT_EXTENSIBLE with a PCM sub-format).
+
+    Walks the chunk list (recorders often put bext/iXML/LIST chunks before "data"), so
+    the header doesn't have to be the canonical 44 bytes. Returns None for anything else
+    (float, 24-bit, RF64, truncated or unfinished recordings whose RIFF/data sizes don't
+    match the file ...); the caller then uses libsndfile, which knows about all of those.
+    """
+    head = os.pread(fd, 12, 0)
+    if len(head) < 12 or head[:4] != b"RIFF" or head[8:12] != b"WAVE":
+        return None
+    # A recorder that hasn't finished (or crashed) leaves the RIFF size unpatched
+    if struct.unpack("<I", head[4:8])[0] + 8 != file_size:
+        return None
+
+    fmt = None
+    offset = 12
+    while offset + 8 <= file_size:
+        chunk_header = os.pread(fd, 8, offset)
+        if len(chunk_header) < 8:
+            return None
+        chunk_id, chunk_size = struct.unpack("<4sI", chunk_header)
+        body = offset + 8
+
+        if chunk_id == b"fmt ":
+            raw = os.pread(fd, min(chunk_size, 40), body)
+            if len(raw) < 16:
+                return None
+            tag, channels, samplerate, _byte_rate, block_align, bits = struct.unpack("<HHIIHH", raw[:16])
+            # WAVE_FORMAT_EXTENSIBLE: the real format code starts the sub-format GUID
+            if tag == 0xFFFE and len(raw) >= 26:
+                tag = struct.unpack("<H", raw[24:26])[0]
+            fmt = (tag, channels, samplerate, block_align, bits)
+
+        elif chunk_id == b"data":
+            if fmt is None:
+                return None
+            tag, channels, samplerate, block_align, bits = fmt
+            if tag != 1 or bits != 16 or channels < 1 or samplerate < 1 or block_align != 2 * channels:
+                return None
+            # Unpatched (0) or overlong data size: leave the odd case to libsndfile
+            if chunk_size == 0 or body + chunk_size > file_size:
+                return None
+            return PcmLayout(
+                samplerate=samplerate,
+                channels=channels,
+                data_offset=body,
+                total_frames=chunk_size // block_align,
+            )
+
+        # Chunks are padded to an even size
+        offset = body + chunk_size + (chunk_size & 1)
+
+    return None
+
+
+class PcmReader:
+    """
+    Reads chunks of a plain 16-bit PCM WAV straight from the file: one positioned read
+    per chunk (no seek, no libsndfile format dispatch/conversion) into this thread's
+    scratch buffer, so nothing is allocated per chunk. A returned chunk is only valid
+    until the next read on the same thread.
+
+    Positioned reads rather than mmap: with a mapping, a file that shrinks mid-scan or a
+    read error (network share hiccup, bad sector) is a SIGBUS that kills the whole run;
+    os.pread raises OSError instead, and the file becomes an ERROR row.
+    """
+
+    dtype = "int16"
+    full_scale = 32768.0
+
+    def __init__(self, fd: int, layout: PcmLayout) -> None:
+        self.fd = fd
+        self.samplerate = layout.samplerate
+        self.channels = layout.channels
+        self.total_frames = layout.total_frames
+        self.data_offset = layout.data_offset
+        self.bytes_per_frame = 2 * layout.channels
+
+    def read(self, start: int, frames: int) -> np.ndarray:
+        frames = max(0, min(frames, self.total_frames - start))
+        buf = batch_buffer((frames * self.channels,), "<i2")
+        nbytes = pread_into(self.fd, buf, self.data_offset + start * self.bytes_per_frame)
+        # A short read (file shrank underneath us) keeps whole samples only
+        return buf[:nbytes // 2]
+
+    def read_peaks(self, reads: list[Tuple[int, int]]) -> np.ndarray:
+        # Each chunk is reduced right after it lands in the scratch buffer; stacking them
+        # into one batch would only add a copy
+        return np.array([peak_abs(self.read(start, frames)) for start, frames in reads])
+
+
+# The first few sampled chunks are checked one by one, so loud files can stop early...
+EARLY_EXIT_CHUNKS = 2
+
+# ...the rest (mostly from silent files, which must be read in full anyway) are read in
+# batches of up to this many bytes and reduced with one NumPy call per batch.
+# This is also how much scratch memory each worker thread keeps (x MAX_WORKERS in total),
+# so it stays small: 4 MiB still holds a 7 s chunk of 48 kHz stereo float32.
+PEAK_BATCH_BYTES = 4 * 1024 * 1024
+
+
+# Per-worker-thread scratch memory that chunks are read into. Reused across reads and files
+# instead of allocating (and page-faulting in) up to PEAK_BATCH_BYTES every time. Freed when
+# the worker thread exits, i.e. when the scan pool shuts down.
+batch_scratch = threading.local()
+
+
+def batch_buffer(shape: Tuple[int, ...], dtype: str) -> np.ndarray:
+    """
+    An uninitialized array of this shape backed by the calling thread's scratch memory,
+    valid until the thread's next batch_buffer() call.
+    Oversized requests (a single read bigger than PEAK_BATCH_BYTES) get a one-off array,
+    so no thread holds on to more than PEAK_BATCH_BYTES.
+    """
+    nbytes = int(np.prod(shape)) * np.dtype(dtype).itemsize
+    if nbytes > PEAK_BATCH_BYTES:
+        return np.empty(shape, dtype=dtype)
+
+    scratch = getattr(batch_scratch, "buf", None)
+    if scratch is None:
+        scratch = np.empty(PEAK_BATCH_BYTES, dtype=np.uint8)
+        batch_scratch.buf = scratch
+    return scratch[:nbytes].view(dtype).reshape(shape)
+
+
+def pread_into(fd: int, buf: np.ndarray, offset: int) -> int:
+    """
+    Fill buf with the file's bytes starting at offset. Returns how many bytes were read,
+    which is less than buf.nbytes only at end of file. I/O errors raise OSError.
+    """
+    view = memoryview(buf).cast("B")
+    if not hasattr(os, "preadv"):
+        # e.g. macOS: plain pread returns a new bytes object, copied into place
+        data = os.pread(fd, len(view), offset)
+        view[:len(data)] = data
+        return len(data)
+
+    done = 0
+    while done < len(view):
+        n = os.preadv(fd, [view[done:]], offset + done)
+        if n == 0:
+            break
+        done += n
+    return done
+
+
+class SoundFileReader:
+    """Reads chunks through libsndfile: any format/subtype it supports."""
+
+    def __init__(self, f: sf.SoundFile) -> None:
+        self.f = f
+        self.samplerate = int(f.samplerate)
+        self.channels = int(f.channels)
+        self.total_frames = int(len(f))
+
+        # 16-bit PCM is read as raw int16: half the bytes of float32 and no int->float
+        # conversion. Everything else goes through float32.
+        if f.subtype == "PCM_16":
+            self.dtype = "int16"
+            self.full_scale = 32768.0
+        else:
+            self.dtype = "float32"
+            self.full_scale = 1.0
+
+    def read(self, start: int, frames: int) -> np.ndarray:
+        # Jump to the chunk start (frame index), then read the chunk. Channel layout doesn't
+        # matter for a peak, so mono comes back 1-D (no 2-D wrapping); exceeds_limit
+        # flattens multichannel chunks as a free view.
+        self.f.seek(start)
+        return self.f.read(frames, dtype=self.dtype, always_2d=False)
+
+    def read_peaks(self, reads: list[Tuple[int, int]]) -> np.ndarray:
+        # libsndfile decodes each read straight into its row of this thread's batch buffer.
+        # Anything a read doesn't cover (short read at EOF, shorter read) is zeroed, which
+        # can't raise a peak.
+        frames = max(n for _, n in reads)
+        batch = batch_buffer((len(reads), frames, self.channels), self.dtype)
+        for row, (start, n) in zip(batch, reads):
+            self.f.seek(start)
+            self.f.read(n, dtype=self.dtype, out=row[:n], fill_value=0)
+            row[n:] = 0
+        return batch_peaks(batch.reshape(len(reads), -1))
+
+
+SampleReader = Union[PcmReader, SoundFileReader]
+
+
+@contextmanager
+def open_sample_reader(wav_path: Path, size_bytes: int) -> Iterator[SampleReader]:
+    """
+    Plain 16-bit PCM WAVs (where we have an fd and os.pread) take the direct PcmReader
+    path; anything else, or any platform without pread, goes through libsndfile.
+    """
+    with sampling_source(wav_path) as source:
+        if isinstance(source, int) and hasattr(os, "pread"):
+            layout = parse_pcm16_wav_header(source, size_bytes)
+            if layout is not None:
+                yield PcmReader(source, layout)
+                return
+
+        # SoundFile allows seeking and reading small chunks without loading the whole WAV
+        try:
+            f = sf.SoundFile(source, closefd=False)
+        except sf.LibsndfileError as e:
+            # Opened through a descriptor, libsndfile's message would name "7", not the file
+            raise sf.LibsndfileError(e.code, f"Error opening {str(wav_path)!r}: ") from None
+        with f:
+            yield SoundFileReader(f)
+
+
+def batch_peaks(batch: np.ndarray) -> np.ndarray:
+    """
+    peak_abs of each row of a (reads x samples) batch, as float64, in one max and one min
+    reduction. The float64 cast keeps -(-32768) from wrapping for int16 data.
+    """
+    return np.maximum(batch.max(axis=1).astype(np.float64), -batch.min(axis=1).astype(np.float64))
+
+
+def probe_peaks(
+    reader: SampleReader,
+    reads: list[Tuple[int, int]],
+    num_early: int,
+    limit: float,
+) -> Iterator[Tuple[bool, float]]:
+    """
+    Yields (exceeded, peak) in raw sample units, in probe order, until the caller stops.
+
+    - The first num_early reads are checked one at a time with exceeds_limit, so most
+      non-silent files are rejected after a block or two
+    - The remaining reads are fetched in batches (see PEAK_BATCH_BYTES) and each batch
+      yields its largest peak; no per-chunk round-trip through Python
+    """
+    for start, num_frames in reads[:num_early]:
+        data = reader.read(start, num_frames)
+
+        # If we got no data, continue (rare edge cases)
+        if data.size == 0:
+            continue
+        yield exceeds_limit(data, limit)
+
+    rest = reads[num_early:]
+    if not rest:
+        return
+
+    read_bytes = max(n for _, n in rest) * reader.channels * np.dtype(reader.dtype).itemsize
+    per_batch = max(1, PEAK_BATCH_BYTES // max(1, read_bytes))
+    for i in range(0, len(rest), per_batch):
+        peaks = reader.read_peaks(rest[i:i + per_batch])
+        if peaks.size == 0:
+            continue
+        peak = float(peaks.max())
+        yield peak > limit, peak
+
+
+def scan_wav_for_silence(
+    wav_path: Path,
+    st: Optional[os.stat_result] = None,
+    cache: Optional[ScanCache] = None,
+) -> ScanResult:
     """
     Returns ScanResult with decision:
       - KEEP: if ANY sampled chunk is above SILENCE_THRESHOLD
       - SILENT: if ALL sampled chunks are at/below SILENCE_THRESHOLD
       - ERROR: if the file cannot be read/parsed
+
+    st is the file's stat result if the caller already has it (from the directory walk);
+    otherwise the file is stat'ed here.
+
+    If a cache is given, unchanged files are judged from their previous scan without
+    being opened, and fresh KEEP/SILENT results are stored for next time. In DELETE mode
+    a cached SILENT is never trusted: the file is scanned again before it can be deleted.
     """
     try:
-        size_bytes = wav_path.stat().st_size
+        if st is None:
+            st = wav_path.stat()
+        size_bytes = st.st_size
 
         # Optional size gate (helps if you want to ignore tiny files)
         if size_bytes < MIN_SIZE_BYTES:
@@ -149,11 +775,18 @@ def scan_wav_for_silence(wav_path: Path) -> ScanResult:
                 max_abs_seen=0.0,
             )
 
-        # SoundFile allows seeking and reading small chunks without loading the whole WAV
-        with sf.SoundFile(wav_path) as f:
-            sr = int(f.samplerate)
-            ch = int(f.channels)
-            total_frames = int(len(f))
+        # Re-run shortcut: reuse the previous scan of an unchanged file. Path + size + mtime
+        # can't tell a replaced file from the original (same-length takes, cp -p, rsync -a),
+        # so nothing is deleted on the strength of a cached result.
+        if cache is not None:
+            cached = cache.lookup(str(wav_path), size_bytes, st.st_mtime_ns)
+            if cached is not None and not (MODE == "DELETE" and cached.decision == "SILENT"):
+                return cached
+
+        with open_sample_reader(wav_path, size_bytes) as reader:
+            sr = reader.samplerate
+            ch = reader.channels
+            total_frames = reader.total_frames
             duration_sec = total_frames / sr if sr > 0 else 0.0
 
             starts, frames_per_interval = compute_sample_positions(
@@ -178,27 +811,28 @@ def scan_wav_for_silence(wav_path: Path) -> ScanResult:
                     max_abs_seen=0.0,
                 )
 
-            max_abs_seen = 0.0
-
-            # Sample a handful of chunks across the file
-            for start in starts:
-                # Jump to the chunk start (frame index)
-                f.seek(int(start))
+            # Chunks come back as raw int16 for 16-bit PCM, float32 otherwise. The threshold
+            # is scaled into the same units, so "peak > limit" means exactly the same as
+            # comparing the normalized float peak against SILENCE_THRESHOLD.
+            full_scale = reader.full_scale
+            limit = SILENCE_THRESHOLD * full_scale
 
-                # Read INTERVAL_SECONDS worth of frames
-                data = f.read(frames_per_interval, dtype="float32", always_2d=True)
+            # INTERVAL_SECONDS worth of frames (or bursts of it) per sampled chunk
+            reads = chunk_reads(starts, frames_per_interval, total_frames)
+            num_early = EARLY_EXIT_CHUNKS * (len(reads) // int(starts.size))
 
-                # If we got no data, continue (rare edge cases)
-                if data.size == 0:
-                    continue
+            max_abs_seen = 0.0
 
-                # Peak absolute amplitude in this chunk
-                peak = float(np.max(np.abs(data)))
+            # Sample a handful of chunks across the file
+            for exceeded, peak_raw in probe_peaks(reader, reads, num_early, limit):
+                # Peak absolute amplitude (normalized to [-1, 1] for reporting). The early
+                # chunks stop at the first block above the limit, so loud ones cost very little.
+                peak = peak_raw / full_scale
                 max_abs_seen = max(max_abs_seen, peak)
 
                 # Early exit: if ANY chunk exceeds threshold, file is NOT silent
-                if peak > SILENCE_THRESHOLD:
-                    return ScanResult(
+                if exceeded:
+                    res = ScanResult(
                         path=str(wav_path),
                         decision="KEEP",
                         detail=f"Non-silent chunk found (peak={peak:.6g} > threshold).",
@@ -211,9 +845,12 @@ def scan_wav_for_silence(wav_path: Path) -> ScanResult:
                         threshold=SILENCE_THRESHOLD,
                         max_abs_seen=max_abs_seen,
                     )
+                    if cache is not None:
+                        cache.store(res, st.st_mtime_ns)
+                    return res
 
             # If we never exceeded the threshold, treat as silent
-            return ScanResult(
+            res = ScanResult(
                 path=str(wav_path),
                 decision="SILENT",
                 detail="All sampled chunks were below threshold.",
@@ -226,6 +863,9 @@ def scan_wav_for_silence(wav_path: Path) -> ScanResult:
                 threshold=SILENCE_THRESHOLD,
                 max_abs_seen=max_abs_seen,
             )
+            if cache is not None:
+                cache.store(res, st.st_mtime_ns)
+            return res
 
     except Exception as e:
         # Any failure (corrupt header, permissions, codec edge case) gets recorded as ERROR
@@ -244,13 +884,20 @@ def scan_wav_for_silence(wav_path: Path) -> ScanResult:
         )
 
 
-def write_csv(path: Path, rows: list[ScanResult]) -> None:
+class ReportWriter:
     """
-    Writes the report CSV. (If Excel has it open, Windows can block overwriting.)
+    The report CSV, written row by row as results arrive instead of all at the end, so an
+    interrupted run still leaves a usable report. Shared by the main thread and the
+    deleter thread.
+
+    Opened at startup, so "Excel has it open" (Windows blocks overwriting) fails before
+    the scan rather than after it.
     """
-    path.parent.mkdir(parents=True, exist_ok=True)
 
-    fieldnames = [
+    # Flush to disk after this many rows
+    FLUSH_EVERY = 100
+
+    FIELDNAMES = [
         "path",
         "decision",
         "detail",
@@ -264,11 +911,17 @@ def write_csv(path: Path, rows: list[ScanResult]) -> None:
         "max_abs_seen",
     ]
 
-    with path.open("w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=fieldnames)
-        w.writeheader()
-        for r in rows:
-            w.writerow({
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._f = path.open("w", newline="", encoding="utf-8")
+        self._w = csv.DictWriter(self._f, fieldnames=self.FIELDNAMES)
+        self._w.writeheader()
+        self._lock = threading.Lock()
+        self._rows = 0
+
+    def write(self, r: ScanResult) -> None:
+        with self._lock:
+            self._w.writerow({
                 "path": r.path,
                 "decision": r.decision,
                 "detail": r.detail,
@@ -281,6 +934,82 @@ def write_csv(path: Path, rows: list[ScanResult]) -> None:
                 "threshold": f"{r.threshold:.6g}",
                 "max_abs_seen": f"{r.max_abs_seen:.6g}",
             })
+            self._rows += 1
+            if self._rows % self.FLUSH_EVERY == 0:
+                self._f.flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._f.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._f.close()
+
+
+class Deleter:
+    """
+    DELETE mode: removes silent files on a dedicated thread, so the scan loop never waits
+    on the filesystem. The queue is drained in groups of up to BATCH files, unlinked back
+    to back. Failures are written to the report as ERROR rows.
+
+    The report is flushed before each group is deleted, so every deleted file's SILENT row
+    is on disk even if the run is killed mid-way.
+
+    The counters are only read after close(), once the thread has finished.
+    """
+
+    BATCH = 100
+
+    def __init__(self, report: ReportWriter, cache: Optional[ScanCache]) -> None:
+        self._report = report
+        self._cache = cache
+        self._queue: queue.Queue[Optional[ScanResult]] = queue.Queue()
+
+        self.deleted_count = 0
+        self.bytes_deleted = 0
+        self.error_count = 0
+
+        self._thread = threading.Thread(target=self._run, name="wav-deleter", daemon=True)
+        self._thread.start()
+
+    def submit(self, res: ScanResult) -> None:
+        self._queue.put(res)
+
+    def close(self) -> None:
+        """Finish every queued delete, then stop the thread."""
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.BATCH:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            self._report.flush()
+            for res in batch:
+                if res is None:
+                    return
+                self._delete(res)
+
+    def _delete(self, res: ScanResult) -> None:
+        try:
+            os.unlink(res.path)
+        except Exception as e:
+            self.error_count += 1
+            # Record delete failure as an ERROR row in the CSV
+            self._report.write(res._replace(decision="ERROR", detail=f"Delete failed: {type(e).__name__}: {e}"))
+            return
+
+        self.deleted_count += 1
+        self.bytes_deleted += res.size_bytes
+        # Best-effort (ScanCache.forget never raises): the file is gone either way
+        if self._cache is not None:
+            self._cache.forget(res.path)
 
 
 def bytes_to_gb(n: int) -> float:
@@ -288,6 +1017,53 @@ def bytes_to_gb(n: int) -> float:
     return n / (1024 ** 3)
 
 
+def scan_tree(
+    root: Path,
+    cache: Optional[ScanCache],
+    max_workers: int,
+    pbar: tqdm,
+) -> Iterator[ScanResult]:
+    """
+    Walk root and scan every .wav file, yielding results (in completion order) on the
+    calling thread.
+
+    A walker thread (walk_wav_files) feeds a bounded queue; this loop moves paths from the
+    queue to the thread pool, keeping only a couple of scans per worker in flight so
+    memory stays flat no matter how big the tree is. The progress bar's total grows as
+    files are discovered.
+    """
+    found: queue.Queue[Optional[WalkItem]] = queue.Queue(maxsize=WALK_QUEUE_SIZE)
+    walker = threading.Thread(target=walk_wav_files, args=(root, found), name="wav-walker", daemon=True)
+    walker.start()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        pending: set[Future[ScanResult]] = set()
+        walking = True
+
+        while walking or pending:
+            # Top up the pool. Only block on the walker when nothing is in flight.
+            while walking and len(pending) < max_workers * 2:
+                try:
+                    item = found.get(block=not pending)
+                except queue.Empty:
+                    break
+                if item is None:
+                    walking = False
+                    break
+                wav, st = item
+                pending.add(ex.submit(scan_wav_for_silence, wav, st, cache))
+                pbar.total = (pbar.total or 0) + 1
+
+            if not pending:
+                continue
+
+            done, pending = wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)
+            for fut in done:
+                yield fut.result()
+
+    walker.join()
+
+
 def main() -> None:
     # Basic validation
     if MODE not in ("AUDIT", "DELETE"):
@@ -296,8 +1072,18 @@ def main() -> None:
     if not ROOT_DIRECTORY.exists() or not ROOT_DIRECTORY.is_dir():
         raise FileNotFoundError(f"ROOT_DIRECTORY is not a directory: {ROOT_DIRECTORY}")
 
-    # Pre-enumerate files so tqdm shows a true progress bar
-    wav_files = find_wav_files(ROOT_DIRECTORY)
+    # Scanning is I/O bound (seek + read), and libsndfile releases the GIL while reading,
+    # so threads let many files be read at once
+    max_workers = MAX_WORKERS if MAX_WORKERS is not None else min(32, (os.cpu_count() or 1) * 4)
+    if max_workers < 1:
+        raise ValueError("MAX_WORKERS must be at least 1 (or None for auto)")
+
+    cache = None
+    if SCAN_CACHE_DB is not None:
+        try:
+            cache = ScanCache(SCAN_CACHE_DB)
+        except (OSError, sqlite3.Error) as e:
+            print(f"Scan cache unavailable, scanning without it: {type(e).__name__}: {e}")
 
     print(f"\n[{datetime.now().isoformat(timespec='seconds')}] Starting scan")
     print(f"ROOT_DIRECTORY       : {ROOT_DIRECTORY}")
@@ -305,8 +1091,11 @@ def main() -> None:
     print(f"INTERVAL_SECONDS     : {INTERVAL_SECONDS}")
     print(f"NUM_SAMPLES_PER_FILE : {NUM_SAMPLES_PER_FILE}")
     print(f"SILENCE_THRESHOLD    : {SILENCE_THRESHOLD}")
+    if BURSTS_PER_INTERVAL > 0:
+        print(f"BURSTS_PER_INTERVAL  : {BURSTS_PER_INTERVAL} x {BURST_FRAMES} frames")
     print(f"REPORT_CSV           : {REPORT_CSV}")
-    print(f"WAV files found      : {len(wav_files)}\n")
+    print(f"SCAN_CACHE_DB        : {SCAN_CACHE_DB}")
+    print(f"Worker threads       : {max_workers}\n")
 
     # Counters for terminal summary
     scanned = 0
@@ -320,53 +1109,45 @@ def main() -> None:
     bytes_candidate_savings = 0
     bytes_deleted_savings = 0
 
-    # Rows we write to CSV:
+    # Rows we write to CSV (as they come in):
     # - Always include SILENT candidates
-    # - Also include ERROR rows (diagnostics)
-    report_rows: list[ScanResult] = []
-
-    # tqdm progress bar over all wav files
-    for wav in tqdm(wav_files, desc="Scanning WAV files", unit="file"):
-        scanned += 1
-
-        res = scan_wav_for_silence(wav)
+    # - Also include ERROR rows (diagnostics, including failed deletes)
+    report = ReportWriter(REPORT_CSV)
+    deleter = Deleter(report, cache) if MODE == "DELETE" else None
 
-        if res.decision == "SILENT":
-            silent_candidates += 1
-            bytes_candidate_savings += res.size_bytes
-            report_rows.append(res)
-
-            if MODE == "DELETE":
-                # Try to delete the file
-                try:
-                    os.remove(res.path)
-                    deleted_count += 1
-                    bytes_deleted_savings += res.size_bytes
-                except Exception as e:
+    try:
+        # Scans run on worker threads; results are aggregated here on the main thread only,
+        # so the counters need no locking. Deletes are handed to the deleter thread.
+        # The progress bar's total grows as the walker discovers files.
+        with tqdm(desc="Scanning WAV files", unit="file", total=0) as pbar:
+            for res in scan_tree(ROOT_DIRECTORY, cache, max_workers, pbar):
+                scanned += 1
+                pbar.update(1)
+
+                if res.decision == "SILENT":
+                    silent_candidates += 1
+                    bytes_candidate_savings += res.size_bytes
+                    report.write(res)
+
+                    if deleter is not None:
+                        deleter.submit(res)
+
+                elif res.decision == "ERROR":
                     error_count += 1
-                    # Record delete failure as an ERROR row in the CSV
-                    report_rows.append(
-                        ScanResult(
-                            path=res.path,
-                            decision="ERROR",
-                            detail=f"Delete failed: {type(e).__name__}: {e}",
-                            size_bytes=res.size_bytes,
-                            duration_sec=res.duration_sec,
-                            samplerate=res.samplerate,
-                            channels=res.channels,
-                            interval_seconds=res.interval_seconds,
-                            num_samples_used=res.num_samples_used,
-                            threshold=res.threshold,
-                            max_abs_seen=res.max_abs_seen,
-                        )
-                    )
+                    report.write(res)
 
-        elif res.decision == "ERROR":
-            error_count += 1
-            report_rows.append(res)
+    finally:
+        # Queued deletes finish (and log any failures) before the report is closed
+        if deleter is not None:
+            deleter.close()
+        report.close()
+        if cache is not None:
+            cache.close()
 
-    # Write CSV report
-    write_csv(REPORT_CSV, report_rows)
+    if deleter is not None:
+        deleted_count = deleter.deleted_count
+        bytes_deleted_savings = deleter.bytes_deleted
+        error_count += deleter.error_count
 
     # Terminal summary
     audit_gb = bytes_to_gb(bytes_candidate_savings)
@@ -375,6 +1156,8 @@ def main() -> None:
     print("\nDone.")
     print(f"Scanned WAV files            : {scanned}")
     print(f"Silent candidates            : {silent_candidates}")
+    if MODE == "DELETE":
+        print(f"Files deleted                : {deleted_count}")
     print(f"Errors                       : {error_count}")
 
     # Print "GB available to be saved" in BOTH modes